@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pandas as pd
 import streamlit as st
 
 from pbi.core_foundation import color_scale_blue_purple, list_base_dates, render_frame
@@ -8,7 +9,7 @@ from pbi.geo_regions import (
     hokkaido_split_selector,
     prefecture_selector,
 )
-from pbi.map_layers import japan_basemap, make_mesh_for_bbox, plot_probability_heatmap
+from pbi.map_layers import japan_basemap, make_mesh_for_bbox, plot_probability_heatmap, release_heatmap_figure
 from pbi.mock_data import synth_probabilities
 from pbi.ui_filters import (
     clamp_horizon,
@@ -26,6 +27,43 @@ from pbi.ui_filters import (
 - 外枠線幅: 0.10（固定）
 """
 
+
+# 基準日が日ごとに変わりキーが増え続けるため、件数と保持期間の両方で上限を設ける
+@st.cache_data(show_spinner=False, max_entries=64, ttl=86400)
+def _synth_cached(
+    n: int,
+    species: str,
+    base_date: str,
+    time_of_day: str,
+    horizon_days: int,
+) -> pd.DataFrame:
+    """`synth_probabilities` をセル数と条件をキーにキャッシュする関数.
+
+    表示系スライダー（透明度・最小確率）だけを動かした再描画では確率を再計算しません。
+
+    引数:
+        n (int): セル数（メッシュのセル id は 0..n-1 の連番）。
+        species (str): 対象とする種名。
+        base_date (str): 基準日（YYYY-MM-DD）。
+        time_of_day (str): 時間帯（"午前" / "午後"）。
+        horizon_days (int): 予測日数。
+
+    戻り値:
+        pd.DataFrame: 'cell_id'列と'prob'列を持つDataFrame。
+
+    注意:
+        - 1 エントリは数百 KB のため、最大 64 件・1 日で破棄してメモリの増加を抑えます。
+    """
+    return synth_probabilities(
+        n=n,
+        species=species,
+        base_date=base_date,
+        time_of_day=time_of_day,
+        horizon_days=horizon_days,
+        data_df=None,
+    )
+
+
 def render_app() -> None:
     """アプリケーションのメイン画面を描画する関数.
 
@@ -49,6 +87,7 @@ def render_app() -> None:
         引数の型と値域を事前に検証してください。
         パフォーマンスや副作用（乱数、時刻、IO）に注意してください。
     """
+    # main はプロセスで一度しか import されないため、ページ設定はモジュール先頭ではなく毎回の実行で行う
     st.set_page_config(page_title="獣害BIツール", page_icon="🦌", layout="wide")
 
     # --- Sidebar ---
@@ -76,6 +115,8 @@ def render_app() -> None:
 
         if not is_species_present(prefecture, hokkaido_part, species):
             st.warning("この種は該当地域には存在しません。")
+            # ヒートマップを描かないため、前回までの Figure（GeoJSON のコピー）をセッションから解放する
+            release_heatmap_figure()
             st.plotly_chart(japan_basemap(), use_container_width=True, config={"scrollZoom": True})
             return
 
@@ -83,13 +124,12 @@ def render_app() -> None:
         mesh_gj, centers_df = make_mesh_for_bbox(
             min_lon=min_lon, min_lat=min_lat, max_lon=max_lon, max_lat=max_lat, km_step=1, padding_km=0
         )
-        probs_df = synth_probabilities(
-            cells_df=centers_df,
+        probs_df = _synth_cached(
+            n=len(centers_df),
             species=species,
             base_date=base_date,
             time_of_day=time_of_day,
             horizon_days=horizon_days,
-            data_df=None,
         )
 
         colorscale = color_scale_blue_purple()
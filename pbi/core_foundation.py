@@ -4,6 +4,16 @@ from datetime import datetime, timedelta, timezone
 
 import streamlit as st
 
+# 青→紫の不透明カラースケール（描画ごとに作り直さないよう不変のタプルで保持）
+_COLOR_SCALE_BLUE_PURPLE = (
+    (0.00, "rgba(230, 244, 255, 1.0)"),
+    (0.10, "rgba(179, 218, 255, 1.0)"),
+    (0.25, "rgba(128, 191, 255, 1.0)"),
+    (0.50, "rgba(102, 140, 255, 1.0)"),
+    (0.75, "rgba(128, 80, 200, 1.0)"),
+    (1.00, "rgba(128, 0, 200, 1.0)"),
+)
+
 
 def render_frame(title: str = "獣害BIツール"):
     """アプリケーションのフレーム（コンテナ）を描画する関数.
@@ -82,12 +92,4 @@ def list_base_dates(max_items: int = 3) -> list[str]:
 
 def color_scale_blue_purple():
     """青から紫の不透明スケール（元の見た目に近い）を返す関数."""
-    return [
-        [0.00, "rgba(230, 244, 255, 1.0)"],
-        [0.10, "rgba(179, 218, 255, 1.0)"],
-        [0.25, "rgba(128, 191, 255, 1.0)"],
-        [0.50, "rgba(102, 140, 255, 1.0)"],
-        [0.75, "rgba(128, 80, 200, 1.0)"],
-        [1.00, "rgba(128, 0, 200, 1.0)"],
-    ]
-
+    return _COLOR_SCALE_BLUE_PURPLE
@@ -54,6 +54,8 @@ PREFS: list[str] = [
     "沖縄県",
 ]
 
+HOKKAIDO_PARTS: list[str] = ["道南", "道央", "道北", "道東"]
+
 
 def prefecture_selector() -> str:
     """都道府県を選択するためのセレクタをサイドバーに表示する関数.
@@ -101,7 +103,7 @@ def hokkaido_split_selector(prefecture: str) -> str | None:
     """
     if prefecture != "北海道":
         return None
-    return st.sidebar.selectbox("北海道の分区", ["道南", "道央", "道北", "道東"], index=1)
+    return st.sidebar.selectbox("北海道の分区", HOKKAIDO_PARTS, index=1)
 
 
 def get_region_center(prefecture: str, hokkaido_area: str | None) -> tuple[float, float]:
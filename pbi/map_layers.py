@@ -1,16 +1,42 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+import functools
+import hashlib
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
-from pyproj import CRS, Transformer
+
+# plotly / pyproj は読み込みが重いため、使う関数の中で import する
+# （事前計算・キャッシュ済みのメッシュだけを使う場合は pyproj を読み込まない）
+if TYPE_CHECKING:
+    from pyproj import Transformer
 
 """地図レイヤ（UTM で 1km メッシュ生成 → WGS84 に戻して Choropleth 描画）."""
 
+_MESH_CACHE_DIR = Path(".mesh_cache")
+# tools/precompute_meshes.py がビルド時に生成する同梱メッシュ（キーは `_mesh_cache_key` と共通）
+_PRECOMPUTED_MESH_DIR = Path("data/meshes")
+# メッシュの生成方法・列の型を変えたら上げる（古いディスクキャッシュを無効化するため）
+_MESH_CACHE_VERSION = 4
+# ディスク上のメッシュ（.npz）に保存する配列名（`_mesh_arrays` の戻り値のキー）
+_MESH_ARRAY_NAMES = ("lattice_lon", "lattice_lat", "cen_lon", "cen_lat")
+# GeoJSON の座標の小数桁数（6 桁で約 0.1m）
+_COORD_DECIMALS = 6
+
+# セルの頂点（左下を原点としたセル幅単位のオフセット、閉じたポリゴン）
+_CORNER_OFFSETS = np.array([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)], dtype=np.float64)
+
+# セッション内で使い回すヒートマップ Figure の session_state キー
+_HEATMAP_FIG_STATE_KEY = "_heatmap_fig"
+
+# ヒートマップの z（確率）を送るときの小数桁数（ホバーにもこの桁で表示される）
+_Z_DECIMALS = 3
+
 @st.cache_resource(show_spinner=False)
 def japan_basemap():
     """日本全体のベースマップを返す関数.
@@ -35,6 +61,8 @@ def japan_basemap():
         - 外部状態（ファイル、環境変数、グローバル設定）に依存する場合があります。
         - 表示スタイルは "carto-positron" 固定です。必要に応じて Mapbox のトークン設定が必要です。
     """
+    import plotly.express as px  # noqa: PLC0415
+
     df = pd.DataFrame(dict(lat=[36.2048], lon=[138.2529]))
     fig = px.scatter_mapbox(df, lat="lat", lon="lon", zoom=4, height=540)
     fig.update_layout(mapbox_style="carto-positron", margin=dict(l=0, r=0, t=0, b=0))
@@ -44,27 +72,54 @@ def japan_basemap():
 # ---------- 内部：座標変換 & メッシュ生成 ----------
 
 
-def _utm_crs_for_lon(lon: float) -> CRS:
-    """経度から対応するUTM座標系（CRS）を返す関数.
+def _utm_zone_for_lon(lon: float) -> int:
+    """経度から対応するUTM帯番号を返す関数.
 
     引数:
         lon (float): 経度（度）。
 
     戻り値:
-        pyproj.CRS: 対応するUTM座標系。
-
-    例外:
-        CRS 生成時に pyproj の例外が発生する可能性があります。
+        int: UTM帯番号（1〜60）。
 
     使用例:
-        >>> _utm_crs_for_lon(139.7)
+        >>> _utm_zone_for_lon(139.7)
+        54
 
     注意:
         - 経度の値域（-180〜180）を想定しています。
         - 日本域は一般に 51〜54帯に該当します。
     """
-    zone = int(np.floor((lon + 180) / 6) + 1)
-    return CRS.from_epsg(32600 + zone)
+    return int(np.floor((lon + 180) / 6) + 1)
+
+
+@functools.lru_cache(maxsize=16)
+def _transformers_for_zone(zone: int) -> tuple[Transformer, Transformer]:
+    """UTM帯ごとに WGS84<->UTM の変換器を生成・キャッシュする関数.
+
+    引数:
+        zone (int): UTM帯番号。
+
+    戻り値:
+        Tuple[Transformer, Transformer]: (WGS84→UTM, UTM→WGS84) の変換器。
+
+    例外:
+        pyproj の内部処理で例外が発生する可能性があります。
+
+    使用例:
+        >>> to_m, to_deg = _transformers_for_zone(54)
+
+    注意:
+        - PROJ パイプラインの構築は重いため、帯ごとに 1 回だけ生成して使い回します。
+        - pyproj 3.1 以降の Transformer はスレッド間で共有できるため、Streamlit の複数セッションから使えます。
+        - always_xy=True により (lon, lat) 順での変換を保証します。
+    """
+    from pyproj import CRS, Transformer  # noqa: PLC0415
+
+    utm = CRS.from_epsg(32600 + zone)
+    wgs84 = CRS.from_epsg(4326)
+    to_m = Transformer.from_crs(wgs84, utm, always_xy=True)
+    to_deg = Transformer.from_crs(utm, wgs84, always_xy=True)
+    return to_m, to_deg
 
 
 def _make_transformers_for_bbox(min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> tuple[Transformer, Transformer]:
@@ -87,50 +142,409 @@ def _make_transformers_for_bbox(min_lon: float, min_lat: float, max_lon: float,
 
     注意:
         - 入力 bbox の中心経度から UTM 帯を推定します。
-        - always_xy=True により (lon, lat) 順での変換を保証します。
+        - 変換器は `_transformers_for_zone` により UTM 帯ごとにキャッシュされます。
     """
     lon_center = (min_lon + max_lon) / 2.0
-    utm = _utm_crs_for_lon(lon_center)
-    wgs84 = CRS.from_epsg(4326)
-    to_m = Transformer.from_crs(wgs84, utm, always_xy=True)
-    to_deg = Transformer.from_crs(utm, wgs84, always_xy=True)
-    return to_m, to_deg
+    return _transformers_for_zone(_utm_zone_for_lon(lon_center))
 
 
-def _iter_cells(bounds_m: tuple[float, float, float, float], cell_size_m: float) -> Iterable[tuple[int, int, list]]:
-    """指定した範囲とセルサイズでメッシュセルを生成するイテレータ.
+def _grid_axes(bounds_m: tuple[float, float, float, float], cell_size_m: float) -> tuple[np.ndarray, np.ndarray]:
+    """指定した範囲とセルサイズでメッシュの格子線の座標（x 軸・y 軸）を返す関数.
 
     引数:
         bounds_m (Tuple[float, float, float, float]): (min_x, min_y, max_x, max_y) のメートル単位バウンディングボックス。
         cell_size_m (float): セル1辺の長さ（メートル）。
 
     戻り値:
-        Iterable[Tuple[int, int, list]]: (列, 行, ポリゴン座標リスト) のタプルを返すイテレータ。
+        Tuple[np.ndarray, np.ndarray]: 形状 (n_x+1,) と (n_y+1,) の float64 配列。
+            セル数は n_x × n_y で、セル (行 r, 列 c) は [xs[c], xs[c+1]] × [ys[r], ys[r+1]] です。
+
+    使用例:
+        >>> xs, ys = _grid_axes((0, 0, 2000, 2000), 1000)
+        >>> xs.tolist()
+        [0.0, 1000.0, 2000.0]
+
+    注意:
+        - 右上端は半開区間として扱われるため、最大値ちょうどから始まるセルは含みません。
+        - どちらかの方向のセル数が 0 の場合は、両方とも 0 セル（長さ 1 の配列）になります。
+    """
+    min_x, min_y, max_x, max_y = bounds_m
+    # 浮動小数の arange ではなく、セル数を整数で決めてから座標を求める
+    n_x = max(0, int(np.ceil((max_x - min_x) / cell_size_m)))
+    n_y = max(0, int(np.ceil((max_y - min_y) / cell_size_m)))
+    if n_x == 0 or n_y == 0:
+        n_x = n_y = 0
+    xs = min_x + cell_size_m * np.arange(n_x + 1, dtype=np.float64)
+    ys = min_y + cell_size_m * np.arange(n_y + 1, dtype=np.float64)
+    return xs, ys
+
+
+def _mesh_arrays(
+    min_lon: float,
+    min_lat: float,
+    max_lon: float,
+    max_lat: float,
+    *,
+    km_step: float,
+    padding_km: float,
+) -> dict[str, np.ndarray]:
+    """メッシュの格子点と中心点の WGS84 座標を計算する関数（キャッシュなし）.
+
+    引数:
+        `make_mesh_for_bbox` と同じです。
+
+    戻り値:
+        Dict[str, np.ndarray]: 次のキーを持つ float64 配列の辞書（ディスクにはこのまま保存します）。
+            - "lattice_lon", "lattice_lat": 形状 (n_y+1, n_x+1) の格子点の経度・緯度
+            - "cen_lon", "cen_lat": 形状 (n_y*n_x,) のセル中心の経度・緯度（行優先）
 
     例外:
-        numpy の arange などで例外が発生する可能性があります。
+        座標変換時に例外が発生する可能性があります。
 
     使用例:
-        >>> for c, r, poly in _iter_cells((0, 0, 2000, 2000), 1000): ...
-        ...     pass
+        >>> arrays = _mesh_arrays(139.6, 35.6, 139.8, 35.8, km_step=1.0, padding_km=0.0)
+    """
+    to_m, to_deg = _make_transformers_for_bbox(min_lon, min_lat, max_lon, max_lat)
+
+    # BBox をメートルに
+    (x0, x1), (y0, y1) = to_m.transform(np.array([min_lon, max_lon]), np.array([min_lat, max_lat]))
+    if x1 < x0:
+        x0, x1 = x1, x0
+    if y1 < y0:
+        y0, y1 = y1, y0
+
+    pad = float(padding_km) * 1000.0
+    cell = max(0.1, float(km_step)) * 1000.0
+    bounds = (x0 - pad, y0 - pad, x1 + pad, y1 + pad)
+
+    xs, ys = _grid_axes(bounds, cell)
+    n_x, n_y = xs.size - 1, ys.size - 1
+
+    # 隣接セルは頂点を共有するため、格子点 (n_y+1)×(n_x+1) だけを WGS84 に戻す
+    # （5N 点ではなく約 N 点の変換で済む。pyproj の呼び出しは格子点・中心でそれぞれ 1 回）
+    lattice_x, lattice_y = np.meshgrid(xs, ys, indexing="xy")
+    # 連続した float64 配列を渡し、要素ごとのエラーチェックは行わない（格子は有限値のみ）
+    lattice_lon, lattice_lat = to_deg.transform(
+        np.ascontiguousarray(lattice_x.ravel()),
+        np.ascontiguousarray(lattice_y.ravel()),
+        radians=False,
+        errcheck=False,
+        inplace=False,
+    )
+    # セル中心は左下の格子線から半セルずらした位置（行優先の並び）
+    cen_x, cen_y = np.meshgrid(xs[:-1] + cell / 2.0, ys[:-1] + cell / 2.0, indexing="xy")
+    cen_lon, cen_lat = to_deg.transform(
+        np.ascontiguousarray(cen_x.ravel()),
+        np.ascontiguousarray(cen_y.ravel()),
+        radians=False,
+        errcheck=False,
+        inplace=False,
+    )
+    return {
+        "lattice_lon": np.asarray(lattice_lon, dtype=np.float64).reshape(n_y + 1, n_x + 1),
+        "lattice_lat": np.asarray(lattice_lat, dtype=np.float64).reshape(n_y + 1, n_x + 1),
+        "cen_lon": np.asarray(cen_lon, dtype=np.float64),
+        "cen_lat": np.asarray(cen_lat, dtype=np.float64),
+    }
+
+
+def _mesh_from_arrays(arrays: dict[str, np.ndarray]) -> tuple[dict, pd.DataFrame]:
+    """`_mesh_arrays` の結果からメッシュ GeoJSON と中心点 DataFrame を組み立てる関数.
+
+    引数:
+        arrays (Dict[str, np.ndarray]): `_mesh_arrays` の戻り値、またはディスクから読み込んだ同じ形の辞書。
+
+    戻り値:
+        Tuple[dict, pd.DataFrame]: `make_mesh_for_bbox` と同じ (GeoJSON, DataFrame)。
+
+    使用例:
+        >>> gj, centers = _mesh_from_arrays(_mesh_arrays(139.6, 35.6, 139.8, 35.8, km_step=1.0, padding_km=0.0))
+    """
+    lattice_lon = arrays["lattice_lon"]
+    lattice_lat = arrays["lattice_lat"]
+    n_cells = arrays["cen_lon"].shape[0]
+    rows_idx, cols = np.divmod(np.arange(n_cells), max(lattice_lon.shape[1] - 1, 1))
+
+    # 各セルの頂点は格子点から添字で取り出す
+    corner_cols = cols[:, None] + _CORNER_OFFSETS[:, 0].astype(np.intp)
+    corner_rows = rows_idx[:, None] + _CORNER_OFFSETS[:, 1].astype(np.intp)
+    poly_lon = lattice_lon[corner_rows, corner_cols]
+    poly_lat = lattice_lat[corner_rows, corner_cols]
+
+    # 座標・行列番号は tolist() で一括して Python オブジェクト化してから Feature を組み立てる
+    # 小数 6 桁（約 0.1m）に丸めて GeoJSON の文字列長を抑える
+    polys_ll = np.round(np.stack([poly_lon, poly_lat], axis=-1), _COORD_DECIMALS).tolist()
+    features = [
+        {
+            "type": "Feature",
+            "id": i,
+            "properties": {"id": i, "row": r, "col": c},
+            "geometry": {"type": "Polygon", "coordinates": [poly]},
+        }
+        for i, (r, c, poly) in enumerate(zip(rows_idx.tolist(), cols.tolist(), polys_ll))
+    ]
+
+    gj = {"type": "FeatureCollection", "features": features}
+    # セル id は int32 で保持し、ヒートマップの locations にコピーなしで渡せるようにする
+    ids = np.arange(len(features), dtype=np.int32)
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "cell_id": ids,
+            "lat": np.asarray(arrays["cen_lat"], dtype=np.float64),
+            "lon": np.asarray(arrays["cen_lon"], dtype=np.float64),
+        }
+    )
+    return gj, df
+
+
+def _mesh_cache_key(
+    min_lon: float,
+    min_lat: float,
+    max_lon: float,
+    max_lat: float,
+    *,
+    km_step: float,
+    padding_km: float,
+) -> str:
+    """メッシュのディスクキャッシュ用キー（bbox と刻み幅のハッシュ）を返す関数.
+
+    引数:
+        min_lon (float): 最小経度（度）。
+        min_lat (float): 最小緯度（度）。
+        max_lon (float): 最大経度（度）。
+        max_lat (float): 最大緯度（度）。
+        km_step (float): メッシュ1辺の長さ（km）。
+        padding_km (float): 外側パディング（km）。
+
+    戻り値:
+        str: 16進数のキー文字列。
+
+    使用例:
+        >>> _mesh_cache_key(139.6, 35.6, 139.8, 35.8, km_step=1.0, padding_km=0.0)
+    """
+    raw = f"v{_MESH_CACHE_VERSION}|{float(min_lon)}|{float(min_lat)}|{float(max_lon)}|{float(max_lat)}|{float(km_step)}|{float(padding_km)}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_mesh_file(path: Path) -> dict[str, np.ndarray] | None:
+    """ディスク上のメッシュ配列（`.npz`）を読み込む関数.
+
+    引数:
+        path (Path): 同梱メッシュ（`data/meshes/`）またはディスクキャッシュ（`.mesh_cache/`）のファイルパス。
+
+    戻り値:
+        Optional[Dict[str, np.ndarray]]: `_mesh_arrays` と同じ形の辞書。ファイルがなければ None。
 
     注意:
-        - 右上端は半開区間として扱われるため、最大値ちょうどは含みません。
-        - 生成されるポリゴンは (x, y) の時計回り座標列です。
+        - numpy の `.npz`（pickle なし）なので、Python・pandas の版に依存せず読み込めます。
+        - 壊れたファイルや形の合わないファイルは存在しないものとして扱い、呼び出し側で作り直します。
     """
-    min_x, min_y, max_x, max_y = bounds_m
-    xs = np.arange(min_x, max_x, cell_size_m)
-    ys = np.arange(min_y, max_y, cell_size_m)
-    for r, y in enumerate(ys):
-        for c, x in enumerate(xs):
-            poly = [(x, y), (x + cell_size_m, y), (x + cell_size_m, y + cell_size_m), (x, y + cell_size_m), (x, y)]
-            yield c, r, poly
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            arrays = {name: npz[name] for name in _MESH_ARRAY_NAMES}
+        n_y, n_x = arrays["lattice_lon"].shape
+        if (
+            arrays["lattice_lat"].shape != (n_y, n_x)
+            or arrays["cen_lon"].shape != ((n_y - 1) * (n_x - 1),)
+            or arrays["cen_lat"].shape != arrays["cen_lon"].shape
+        ):
+            raise ValueError(f"unexpected mesh array shapes in {path}")
+    except Exception:
+        # 読めない理由（破損・キー不足・形の不一致など）は問わず、キャッシュなしとして作り直す
+        return None
+    return arrays
+
+
+def _write_mesh_file(path: Path, arrays: dict[str, np.ndarray]) -> None:
+    """メッシュ配列を `.npz` として書き出す関数.
+
+    引数:
+        path (Path): 書き出し先のファイルパス（親ディレクトリは作成済みであること）。
+        arrays (Dict[str, np.ndarray]): `_mesh_arrays` の戻り値。
+
+    例外:
+        OSError: 書き込みに失敗した場合（一時ファイルは削除されます）。
+
+    注意:
+        - 書き込みごとに一意な一時ファイルへ書いてから置き換えるため、複数ワーカーが同時に書いても
+          途中状態のファイルは読まれません。
+    """
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            tmp_path = Path(f.name)
+            np.savez_compressed(f, **{name: arrays[name] for name in _MESH_ARRAY_NAMES})
+        tmp_path.replace(path)
+    except OSError:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _save_mesh_cache(key: str, arrays: dict[str, np.ndarray]) -> None:
+    """メッシュ配列をディスクキャッシュに保存する関数.
+
+    引数:
+        key (str): `_mesh_cache_key` で得たキー。
+        arrays (Dict[str, np.ndarray]): `_mesh_arrays` の戻り値。
+
+    注意:
+        - 書き込めない環境（読み取り専用ディスク等）では何もしません。
+    """
+    cache_dir = _mesh_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _prune_stale_mesh_cache()
+        _write_mesh_file(cache_dir / f"{key}.npz", arrays)
+    except OSError:
+        pass
+
+
+def _mesh_cache_dir() -> Path:
+    """現在の `_MESH_CACHE_VERSION` 用のディスクキャッシュディレクトリを返す関数."""
+    return _MESH_CACHE_DIR / f"v{_MESH_CACHE_VERSION}"
+
+
+@functools.lru_cache(maxsize=1)
+def _prune_stale_mesh_cache() -> None:
+    """古い `_MESH_CACHE_VERSION` のキャッシュディレクトリを削除する関数（プロセスごとに 1 回）.
+
+    注意:
+        - 生成方法を変えて版を上げるたびに `.mesh_cache/` が増え続けないようにします。
+        - 他のワーカーが同時に削除していても失敗にはしません。
+    """
+    current = _mesh_cache_dir()
+    for child in _MESH_CACHE_DIR.iterdir():
+        if child.is_dir() and child != current:
+            shutil.rmtree(child, ignore_errors=True)
+        elif child.is_file():
+            child.unlink(missing_ok=True)
+
+
+def _mesh_key(mesh_geojson: dict) -> tuple:
+    """メッシュ GeoJSON を識別する軽量なキー（件数と先頭・末尾セルの頂点）を返す関数.
+
+    引数:
+        mesh_geojson (dict): `make_mesh_for_bbox` が返す GeoJSON。
+
+    戻り値:
+        tuple: 件数と先頭・末尾セルの最初の頂点からなるタプル。
+
+    注意:
+        - `st.cache_data` はコピーを返すため、オブジェクトの id() ではなく内容から識別します。
+    """
+    features = mesh_geojson["features"]
+    if not features:
+        return (0,)
+    first = features[0]["geometry"]["coordinates"][0][0]
+    last = features[-1]["geometry"]["coordinates"][0][0]
+    return (len(features), *first, *last)
+
+
+def _probs_key(ids: np.ndarray, probs: np.ndarray) -> str:
+    """セル id と確率配列の内容ハッシュを返す関数.
+
+    引数:
+        ids (np.ndarray): セル id の配列。
+        probs (np.ndarray): 確率の配列。
+
+    戻り値:
+        str: 16進数のハッシュ文字列。
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(ids).tobytes())
+    h.update(np.ascontiguousarray(probs).tobytes())
+    return h.hexdigest()
+
+
+@st.cache_resource(show_spinner=False, max_entries=4, ttl=3600)
+def _canonical_mesh_geojson(
+    mesh_key: tuple,  # noqa: ARG001  ハッシュ用の引数（キャッシュキーにのみ使う）
+    _mesh_geojson: dict,
+) -> dict:
+    """同じメッシュについてプロセス内で共有する 1 つの GeoJSON を返す関数.
+
+    `make_mesh_for_bbox` は `st.cache_data` のため呼び出しごとに別のコピーを返します。
+    最初に渡されたコピーだけを保持し、以降はそれを返すことで、描画用 GeoJSON の元データを 1 つにします。
+
+    引数:
+        mesh_key (tuple): `_mesh_key` によるメッシュのキー（ハッシュ専用。本体では使いません）。
+        _mesh_geojson (dict): メッシュの GeoJSON（キャッシュキーには使いません）。
+
+    戻り値:
+        dict: キャッシュ済みのメッシュ GeoJSON。
+
+    注意:
+        - 戻り値はセッション間で共有されるため、呼び出し側で変更しないでください。
+        - キャッシュから外れても、呼び出し側が持つコピーを保持し直すだけなので再計算は発生しません。
+    """
+    return _mesh_geojson
+
+
+@st.cache_resource(show_spinner=False, max_entries=16, ttl=3600)
+def _heatmap_selection(
+    mesh_key: tuple,  # noqa: ARG001  ハッシュ用の引数（キャッシュキーにのみ使う）
+    probs_key: str,  # noqa: ARG001  ハッシュ用の引数（キャッシュキーにのみ使う）
+    min_prob: float,
+    _ids: np.ndarray,
+    _probs: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """閾値で絞り込んだ locations と z を生成する関数.
+
+    引数:
+        mesh_key (tuple): `_mesh_key` によるメッシュのキー（ハッシュ専用。本体では使いません）。
+        probs_key (str): `_probs_key` による確率データのキー（ハッシュ専用。本体では使いません）。
+        min_prob (float): 表示する最小確率。
+        _ids (np.ndarray): セル id の配列（キャッシュキーには使いません）。
+        _probs (np.ndarray): 確率の配列（キャッシュキーには使いません）。
+
+    戻り値:
+        Tuple[np.ndarray, np.ndarray]: (locations, z)。ndarray のまま Plotly に渡します。
+
+    注意:
+        - キャッシュするのは 1 エントリあたり数百 KB の配列だけで、GeoJSON は保持しません。
+        - 戻り値はセッション間で共有されるため、読み取り専用にしています。
+    """
+    mask = _probs >= np.float32(min_prob)
+    feature_ids = _ids[mask]
+    # z は確率のまま（ホバーに表示されるため）小数 3 桁に丸め、JSON 上の数値の桁数を抑えて送る
+    z = np.round(_probs[mask], _Z_DECIMALS)
+    feature_ids.flags.writeable = False
+    z.flags.writeable = False
+    return feature_ids, z
+
+
+def _slim_geojson(mesh_geojson: dict, feature_ids: np.ndarray) -> dict:
+    """描画するセルの Feature だけを含む軽量な FeatureCollection を返す関数.
+
+    引数:
+        mesh_geojson (dict): メッシュの GeoJSON（`_canonical_mesh_geojson` の戻り値）。
+        feature_ids (np.ndarray): 描画するセル id の配列。
+
+    戻り値:
+        dict: id と geometry だけを持つ Feature の FeatureCollection（geometry は元の GeoJSON と共有）。
+
+    注意:
+        - Feature の id が 0 始まりの連番なら位置で、そうでなければ id の集合で Feature を選びます。
+    """
+    features = mesh_geojson["features"]
+    if features and features[0]["id"] == 0 and features[-1]["id"] == len(features) - 1:
+        kept = [features[i] for i in feature_ids.tolist()]
+    else:
+        kept_ids = set(feature_ids.tolist())
+        kept = [f for f in features if f["id"] in kept_ids]
+    # 描画には id と geometry しか使わないため、properties を省いた軽量な Feature にする
+    slim = [{"type": "Feature", "id": f["id"], "geometry": f["geometry"]} for f in kept]
+    return {"type": "FeatureCollection", "features": slim}
 
 
 # ---------- 公開 API ----------
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, max_entries=32)
 def make_mesh_for_bbox(
     min_lon: float,
     min_lat: float,
@@ -152,7 +566,7 @@ def make_mesh_for_bbox(
     戻り値:
         Tuple[dict, pd.DataFrame]: GeoJSON 形式のメッシュと中心点情報の DataFrame。
             - GeoJSON: FeatureCollection（各 Feature は "properties.id" を持つ）
-            - DataFrame: 列 {id, cell_id, lat, lon}
+            - DataFrame: 列 {id, cell_id, lat, lon}（id・cell_id は int32）
 
     例外:
         座標変換や DataFrame 生成時に例外が発生する可能性があります。
@@ -162,48 +576,74 @@ def make_mesh_for_bbox(
 
     注意:
         - UTM に変換後に格子生成し、WGS84 に戻します（距離の歪み低減）。
+        - `data/meshes/` に同梱済みのメッシュがあればそれを読み込み、pyproj を使いません。
+        - それ以外の結果は `.mesh_cache/v{版}/` にも保存され、プロセスを跨いで再利用されます。
+          古い `_MESH_CACHE_VERSION` のディレクトリは保存時に削除されます。
         - `km_step` と `padding_km` は 0 未満にならないようバリデーションしてください。
     """
-    to_m, to_deg = _make_transformers_for_bbox(min_lon, min_lat, max_lon, max_lat)
+    key = _mesh_cache_key(min_lon, min_lat, max_lon, max_lat, km_step=km_step, padding_km=padding_km)
+    arrays = _load_mesh_file(_PRECOMPUTED_MESH_DIR / f"{key}.npz")
+    if arrays is None:
+        arrays = _load_mesh_file(_mesh_cache_dir() / f"{key}.npz")
+    if arrays is None:
+        arrays = _mesh_arrays(min_lon, min_lat, max_lon, max_lat, km_step=km_step, padding_km=padding_km)
+        _save_mesh_cache(key, arrays)
+    return _mesh_from_arrays(arrays)
+
+
+def precompute_mesh(
+    bbox: tuple[float, float, float, float],
+    km_step: float,
+    padding_km: float,
+    out_dir: Path | None = None,
+) -> tuple[Path, int]:
+    """メッシュを事前計算し、`make_mesh_for_bbox` が読み込む同梱メッシュとして書き出す関数.
 
-    # BBox をメートルに
-    x0, y0 = to_m.transform(min_lon, min_lat)
-    x1, y1 = to_m.transform(max_lon, max_lat)
-    if x1 < x0:
-        x0, x1 = x1, x0
-    if y1 < y0:
-        y0, y1 = y1, y0
+    引数:
+        bbox (Tuple[float, float, float, float]): (min_lon, min_lat, max_lon, max_lat)（度）。
+        km_step (float): メッシュ1辺の長さ（km）。実行時の呼び出しと同じ値にしてください。
+        padding_km (float): 外側パディング（km）。実行時の呼び出しと同じ値にしてください。
+        out_dir (Optional[Path]): 書き出し先ディレクトリ（デフォルトは `data/meshes/`）。
 
-    pad = float(padding_km) * 1000.0
-    cell = max(0.1, float(km_step)) * 1000.0
-    bounds = (x0 - pad, y0 - pad, x1 + pad, y1 + pad)
+    戻り値:
+        Tuple[Path, int]: (書き出したファイルのパス, セル数)。
 
-    features = []
-    rows = []
-    fid = 0
-    for c, r, poly_m in _iter_cells(bounds, cell):
-        # 中心点（m）
-        cx = (poly_m[0][0] + poly_m[2][0]) / 2.0
-        cy = (poly_m[0][1] + poly_m[2][1]) / 2.0
-
-        # ポリゴンと中心を WGS84 に戻す
-        poly_lonlat = [to_deg.transform(px, py) for (px, py) in poly_m]
-        cen_lon, cen_lat = to_deg.transform(cx, cy)
-
-        features.append(
-            {
-                "type": "Feature",
-                "id": fid,
-                "properties": {"id": fid, "row": int(r), "col": int(c)},
-                "geometry": {"type": "Polygon", "coordinates": [poly_lonlat]},
-            }
-        )
-        rows.append({"id": fid, "cell_id": fid, "lat": float(cen_lat), "lon": float(cen_lon)})
-        fid += 1
+    例外:
+        座標変換やファイル書き込み時に例外が発生する可能性があります。
 
-    gj = {"type": "FeatureCollection", "features": features}
-    df = pd.DataFrame(rows)
-    return gj, df
+    使用例:
+        >>> precompute_mesh((139.6, 35.6, 139.8, 35.8), 1.0, 0.0)
+
+    注意:
+        - ファイル名は bbox・刻み幅・`_MESH_CACHE_VERSION` から決まるキーで、実行時の引数と一致した場合のみ使われます。
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    out_dir = _PRECOMPUTED_MESH_DIR if out_dir is None else Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    key = _mesh_cache_key(min_lon, min_lat, max_lon, max_lat, km_step=km_step, padding_km=padding_km)
+    arrays = _mesh_arrays(min_lon, min_lat, max_lon, max_lat, km_step=km_step, padding_km=padding_km)
+    path = out_dir / f"{key}.npz"
+    _write_mesh_file(path, arrays)
+    return path, int(arrays["cen_lon"].size)
+
+
+def release_heatmap_figure() -> None:
+    """セッションに保持しているヒートマップ Figure を解放する関数.
+
+    引数:
+        なし
+
+    戻り値:
+        なし
+
+    使用例:
+        >>> release_heatmap_figure()
+
+    注意:
+        - ベースマップだけを表示する画面では、使わない GeoJSON のコピーをセッションに残さないよう呼び出してください。
+        - 保持していない場合は何もしません。
+    """
+    st.session_state.pop(_HEATMAP_FIG_STATE_KEY, None)
 
 
 def plot_probability_heatmap(
@@ -223,7 +663,7 @@ def plot_probability_heatmap(
     UI の色・スタイルは外部から与えられる `colorscale` と引数で制御します（コードでは変更しません）。
 
     引数:
-        mesh_geojson (dict): メッシュの GeoJSON（Feature の "properties.id" を featureidkey に対応させる）。
+        mesh_geojson (dict): メッシュの GeoJSON（Feature のトップレベル "id" を locations に対応させる）。
         probs_df (pd.DataFrame): セルごとの確率データ。少なくとも {cell_id または id, prob} 列が必要。
         center_lat (float): 地図の中心緯度。
         center_lon (float): 地図の中心経度。
@@ -245,39 +685,69 @@ def plot_probability_heatmap(
     注意:
         - `probs_df` に必要列が欠落している場合はフォールバックとして `japan_basemap()` を返します。
         - `min_prob` で z 値をフィルタします。z は [0,1] を想定しています。
+        - z は確率を小数 3 桁に丸めて送ります（ホバーには丸めた確率が表示されます）。
+        - フィルタ後に残ったセルの Feature だけを、properties を省いた形で GeoJSON に含めて Plotly に渡します。
+        - 絞り込み結果（locations と z の配列のみ）は `_heatmap_selection` でキャッシュされます。
+        - GeoJSON はメッシュごとに 1 つだけ `_canonical_mesh_geojson` で共有し、Figure を作り直すときだけ絞り込みます。
+        - 返す Figure はセッション内で使い回されるため、呼び出し側で保持・変更しないでください。
+        - Figure は `st.session_state` にセッションごとに 1 つだけ保持されます。Plotly が trace 作成時に GeoJSON を
+          deepcopy するため、1 セッションあたり描画セル数に比例したメモリ（約 2.6 万セルの全表示で約 25MB）を使います。
+          メッシュ・確率・閾値が変わると前の Figure を先に解放してから作り直します。ヒートマップを描かない
+          画面（ベースマップのみ）に切り替えるときは `release_heatmap_figure()` を呼んで解放してください。
         - `mapbox_style` は "carto-positron"、`mapbox_zoom` は 6.5 に固定しています（UI 側要件に合わせて変更しません）。
     """
-    df = probs_df.copy()
-    id_col = "cell_id" if "cell_id" in df.columns else ("id" if "id" in df.columns else None)
-    if id_col is None or "prob" not in df.columns:
+    import plotly.graph_objects as go  # noqa: PLC0415
+
+    columns = probs_df.columns
+    id_col = "cell_id" if "cell_id" in columns else ("id" if "id" in columns else None)
+    if id_col is None or "prob" not in columns:
+        release_heatmap_figure()
         return japan_basemap()
 
-    df = df.loc[df["prob"].astype(float) >= float(min_prob)]
-    feature_ids = df[id_col].astype(int).tolist()
-    z = df["prob"].astype(float).tolist()
-
-    fig = go.Figure()
-    fig.add_trace(
-        go.Choroplethmapbox(
-            geojson=mesh_geojson,
-            featureidkey="properties.id",
-            locations=feature_ids,
-            z=z,
-            colorscale=colorscale,
-            zmin=0.0,
-            zmax=1.0,
-            marker=dict(line=dict(width=float(grid_outline_width))),
-            showscale=True,
-            name="Probability",
-            marker_opacity=float(opacity),
+    # DataFrame はコピーせず列の ndarray を取り出し、絞り込み結果はメッシュ・確率・閾値ごとにキャッシュする
+    probs = probs_df["prob"].to_numpy(dtype=np.float32, copy=False)
+    ids = probs_df[id_col].to_numpy(dtype=np.int32, copy=False)
+    mesh_key = _mesh_key(mesh_geojson)
+    probs_key = _probs_key(ids, probs)
+    base_key = (mesh_key, probs_key, float(min_prob))
+
+    # Plotly は trace 追加時に GeoJSON を deepcopy するため、同じデータの Figure はセッション内で 1 つだけ使い回し、
+    # 見た目だけの引数（色・透明度・枠線・中心）は毎回 update で差し替える（Plotly.react 相当）。
+    # Figure を作り直すときも、共有キャッシュから取るのは locations・z の配列と正規化済みメッシュだけにする
+    cached = st.session_state.get(_HEATMAP_FIG_STATE_KEY)
+    if cached is not None and cached[0] == base_key:
+        fig = cached[1]
+    else:
+        # 新しい Figure を作る前に前の Figure（別地域・別条件の GeoJSON のコピー）を手放し、2 つ同時に持たない
+        cached = None
+        release_heatmap_figure()
+        feature_ids, z = _heatmap_selection(mesh_key, probs_key, float(min_prob), ids, probs)
+        geojson = _slim_geojson(_canonical_mesh_geojson(mesh_key, mesh_geojson), feature_ids)
+        fig = go.Figure()
+        fig.add_trace(
+            go.Choroplethmapbox(
+                geojson=geojson,
+                locations=feature_ids,
+                z=z,
+                zmin=0.0,
+                zmax=1.0,
+                showscale=True,
+                name="Probability",
+            )
         )
-    )
+        fig.update_layout(
+            mapbox_style="carto-positron",
+            uirevision="base",
+            mapbox_zoom=6.5,
+            margin=dict(l=0, r=0, t=0, b=0),
+        )
+        st.session_state[_HEATMAP_FIG_STATE_KEY] = (base_key, fig)
 
-    fig.update_layout(
-        mapbox_style="carto-positron",
-        uirevision="base",
-        mapbox_zoom=6.5,
-        mapbox_center={"lat": float(center_lat), "lon": float(center_lon)},
-        margin=dict(l=0, r=0, t=0, b=0),
+    fig.update_traces(
+        colorscale=colorscale,
+        marker=dict(line=dict(width=float(grid_outline_width))),
+        marker_opacity=float(opacity),
+        selector=dict(type="choroplethmapbox"),
     )
+    fig.update_layout(mapbox_center={"lat": float(center_lat), "lon": float(center_lon)})
     return fig
@@ -1,11 +1,34 @@
 from __future__ import annotations
 
+import hashlib
+
 import numpy as np
 import pandas as pd
 
 
+def _synth_core(n: int, seed: int) -> np.ndarray:
+    """確率値の数値計算部分（DataFrame を介さず ndarray を返す）.
+
+    引数:
+        n (int): セル数。
+        seed (int): 乱数シード。
+
+    戻り値:
+        np.ndarray: 形状 (n,) の [0, 1) の確率値（float32）。
+
+    使用例:
+        >>> _synth_core(3, 0).shape
+        (3,)
+    """
+    rng = np.random.default_rng(seed)
+    # 色の参照にしか使わないため float32 で十分（配列サイズが半分になる）
+    prob = rng.random(n, dtype=np.float32)
+    np.square(prob, out=prob)  # 一時配列を作らずにその場で二乗する
+    return prob
+
+
 def synth_probabilities(
-    cells_df: pd.DataFrame,
+    n: int,
     species: str,
     base_date: str,
     time_of_day: str,
@@ -18,7 +41,7 @@ def synth_probabilities(
     実際のデータやモデルには依存せず、主にデモやテスト用途で利用されます。
 
     引数:
-        cells_df (pd.DataFrame): セル情報を含むDataFrame。'cell_id'または'id'列が必要です。
+        n (int): セル数。セル id は `make_mesh_for_bbox` と同じ 0..n-1 の連番とみなします。
         species (str): 対象とする種名。
         base_date (str): 基準日（YYYY-MM-DD形式など）。
         time_of_day (str): 時間帯（例: "午前", "午後"）。
@@ -26,30 +49,23 @@ def synth_probabilities(
         data_df (Optional[pd.DataFrame]): 追加データ（未使用、デフォルトNone）。
 
     戻り値:
-        pd.DataFrame: 'cell_id'列と'prob'列を持つDataFrame。
+        pd.DataFrame: 'cell_id'列（0..n-1）と'prob'列を持つDataFrame。
 
     例外:
-        入力DataFrameに必要な列が存在しない場合や、乱数生成・型変換時に例外が発生する可能性があります。
+        乱数生成・型変換時に例外が発生する可能性があります。
 
     使用例:
-        >>> synth_probabilities(cells_df, species, base_date, time_of_day, horizon_days)
+        >>> synth_probabilities(len(centers_df), species, base_date, time_of_day, horizon_days)
 
     注意:
         外部状態（ファイル、環境変数、グローバル設定）に依存する場合があります。
         引数の型と値域を事前に検証してください。
         パフォーマンスや副作用（乱数、時刻、IO）に注意してください。
+        同じ条件なら、プロセスやワーカーが異なっても同じ確率値を返します。
     """
-    n = len(cells_df)
-    seed = abs(hash((species, base_date, time_of_day, int(horizon_days)))) % (2**32)
-    rng = np.random.default_rng(seed)
-    prob = rng.random(n) ** 2
-
-    out = pd.DataFrame()
-    if "cell_id" in cells_df.columns:
-        out["cell_id"] = cells_df["cell_id"].astype(int).values
-    elif "id" in cells_df.columns:
-        out["cell_id"] = cells_df["id"].astype(int).values
-    else:
-        out["cell_id"] = np.arange(n, dtype=int)
-    out["prob"] = prob
-    return out
+    n = int(n)
+    # hash() は PYTHONHASHSEED でプロセスごとに変わるため、BLAKE2 で決定的なシードを作る
+    key = f"{species}|{base_date}|{time_of_day}|{int(horizon_days)}".encode()
+    seed = int.from_bytes(hashlib.blake2b(key, digest_size=4).digest(), "little")
+    prob = _synth_core(n, seed)
+    return pd.DataFrame({"cell_id": np.arange(n, dtype=np.int32), "prob": prob}, copy=False)
@@ -1,18 +1,49 @@
 from __future__ import annotations
 
-import json
+import functools
+from pathlib import Path
 
 try:
-    from validation import validate_species_for_prefecture  # fallback
-except Exception:
-    validate_species_for_prefecture = None  # type: ignore
-
-from pathlib import Path
+    import orjson as _json  # bytes を直接パースでき、標準 json より高速
+except ImportError:
+    import json as _json
 
 import streamlit as st
 
 from pbi.geo_regions import get_region_center
 
+# 「午前」とみなす時間帯の表記
+_MORNING: frozenset[str] = frozenset({"午前", "AM", "am", "morning"})
+
+
+def _load_json_override(path: Path) -> dict | None:
+    """上書き用 JSON（data/ 配下）を読み込む関数.
+
+    引数:
+        path (Path): JSON ファイルのパス。
+
+    戻り値:
+        Optional[dict]: ファイルが存在すればパース結果、なければ None。
+
+    例外:
+        ファイルIOやJSONパース時に例外が発生する可能性があります。
+    """
+    if not path.exists():
+        return None
+    return _json.loads(path.read_bytes())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_presence() -> dict | None:
+    """data/presence.json を一度だけ読み込んでキャッシュする関数（ファイルがなければ None）."""
+    return _load_json_override(Path("data/presence.json"))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pref_bboxes() -> dict | None:
+    """data/pref_bboxes.json を一度だけ読み込んでキャッシュする関数（ファイルがなければ None）."""
+    return _load_json_override(Path("data/pref_bboxes.json"))
+
 
 def species_selector() -> str:
     """種別（熊・鹿・猪）を選択するセレクタをサイドバーに表示する関数.
@@ -59,11 +90,10 @@ def is_species_present(prefecture: str, hokkaido_part: str | None, species_jp: s
 
     注意:
         外部状態（ファイル、環境変数、グローバル設定）に依存する場合があります。
-        パフォーマンスや副作用（IO等）に注意してください。
+        presence.json はプロセス内で一度だけ読み込まれます（変更の反映には再起動が必要です）。
     """
-    override = Path("data/presence.json")
-    if override.exists():
-        data = json.loads(override.read_text(encoding="utf-8"))
+    data = _load_presence()
+    if data is not None:
         key = prefecture if (prefecture != "北海道" or not hokkaido_part) else f"北海道|{hokkaido_part}"
         return bool(data.get(key, {}).get(species_jp, True))
     return True
@@ -89,11 +119,10 @@ def get_pref_bbox(prefecture: str, hokkaido_part: str | None) -> tuple[float, fl
 
     注意:
         外部状態（ファイル、環境変数、グローバル設定）に依存する場合があります。
-        パフォーマンスや副作用（IO等）に注意してください。
+        data/pref_bboxes.json はプロセス内で一度だけ読み込まれます（変更の反映には再起動が必要です）。
     """
-    override = Path("data/pref_bboxes.json")
-    if override.exists():
-        data = json.loads(override.read_text(encoding="utf-8"))
+    data = _load_pref_bboxes()
+    if data is not None:
         key = prefecture if (prefecture != "北海道" or not hokkaido_part) else f"北海道|{hokkaido_part}"
         v = data.get(key)
         if v and len(v) == 4:
@@ -141,4 +170,4 @@ def normalize_time_of_day(value: str) -> str:
     注意:
         引数の型と値域を事前に検証してください。
     """
-    return "午前" if value in ("午前", "AM", "am", "morning") else "午後"
+    return "午前" if value in _MORNING else "午後"
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pbi.geo_regions import HOKKAIDO_PARTS, PREFS
+from pbi.map_layers import precompute_mesh
+from pbi.ui_filters import get_pref_bbox
+
+"""全都道府県（北海道は4分区）のメッシュを事前計算して data/meshes/ に書き出すスクリプト.
+
+リポジトリのルートで `python -m tools.precompute_meshes` として実行します。
+"""
+
+# main.py の make_mesh_for_bbox 呼び出しと揃える
+KM_STEP = 1.0
+PADDING_KM = 0.0
+
+
+def iter_regions() -> list[tuple[str, str | None]]:
+    """事前計算の対象となる (都道府県, 北海道分区) の一覧を返す関数.
+
+    引数:
+        なし
+
+    戻り値:
+        List[Tuple[str, Optional[str]]]: 北海道は分区ごと、それ以外は分区 None の組。
+
+    使用例:
+        >>> iter_regions()[:2]
+    """
+    regions: list[tuple[str, str | None]] = []
+    for pref in PREFS:
+        if pref == "北海道":
+            regions.extend((pref, part) for part in HOKKAIDO_PARTS)
+        else:
+            regions.append((pref, None))
+    return regions
+
+
+def main() -> None:
+    """全地域のメッシュを生成し、`data/meshes/{key}.npz` に保存する関数.
+
+    引数:
+        なし
+
+    戻り値:
+        なし
+
+    例外:
+        座標変換やファイル書き込み時に例外が発生する可能性があります。
+
+    使用例:
+        >>> main()
+
+    注意:
+        - 各ファイルは `precompute_mesh` が書き出し、実行時の bbox・刻み幅と一致した場合のみ使われます。
+        - `data/pref_bboxes.json` を変更した場合や `_MESH_CACHE_VERSION` を上げた場合は再実行してください。
+        - 保存するのは格子点・中心点の配列（pickle なしの `.npz`）だけなので、Python や pandas の版に依存しません。
+    """
+    for pref, part in iter_regions():
+        path, n_cells = precompute_mesh(get_pref_bbox(pref, part), KM_STEP, PADDING_KM)
+        label = pref if part is None else f"{pref}|{part}"
+        print(f"{label}: {n_cells} cells -> {path}")
+
+if __name__ == "__main__":
+    main()